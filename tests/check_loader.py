@@ -0,0 +1,40 @@
+import ast
+import bisect
+import hashlib
+import hmac
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+CHECK_PY = Path(__file__).resolve().parent.parent / "Check.py"
+
+
+def _defined_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    return None
+
+
+def load_definitions(*names):
+    # Importing Check.py runs the whole Streamlit app, so tests compile only the top-level
+    # functions, classes and constants they need, in file order
+    tree = ast.parse(CHECK_PY.read_text(encoding="utf-8"))
+    nodes = [node for node in tree.body if _defined_name(node) in names]
+    missing = set(names) - {_defined_name(node) for node in nodes}
+    if missing:
+        raise LookupError(f"not defined at the top level of Check.py: {', '.join(sorted(missing))}")
+    for node in nodes:
+        if isinstance(node, ast.FunctionDef):
+            node.decorator_list = []  # st.cache_resource and friends
+    namespace = {
+        "re": re, "time": time, "threading": threading, "hmac": hmac, "hashlib": hashlib,
+        "bisect": bisect, "OrderedDict": OrderedDict, "timedelta": timedelta, "AUTH_SETTINGS": {},
+    }
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), str(CHECK_PY), "exec"), namespace)
+    return SimpleNamespace(**{name: namespace[name] for name in names})
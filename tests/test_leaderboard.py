@@ -0,0 +1,44 @@
+from check_loader import load_definitions
+
+check = load_definitions("Leaderboard")
+
+
+def make_board(scores):
+    board = check.Leaderboard()
+    for video_id, value in scores.items():
+        board.set(video_id, value)
+    return board
+
+
+def test_leaders_include_every_tie():
+    board = make_board({"a": 5, "b": 9, "c": 9, "d": 1})
+    assert board.top() == [(9, ["b", "c"])]
+
+
+def test_top_n_keeps_ties_at_the_cut_off():
+    board = make_board({"a": 9, "b": 7, "c": 7, "d": 7, "e": 3})
+    assert board.top(2) == [(9, ["a"]), (7, ["b", "c", "d"])]
+
+
+def test_top_n_stops_once_covered():
+    board = make_board({"a": 9, "b": 8, "c": 7})
+    assert board.top(2) == [(9, ["a"]), (8, ["b"])]
+
+
+def test_top_n_larger_than_board():
+    board = make_board({"a": 2, "b": 1})
+    assert board.top(10) == [(2, ["a"]), (1, ["b"])]
+
+
+def test_zero_and_missing_values_are_not_ranked():
+    board = make_board({"a": 0, "b": None, "c": 4})
+    assert board.top(5) == [(4, ["c"])]
+
+
+def test_moving_a_video_out_of_a_tie():
+    board = make_board({"a": 5, "b": 5})
+    board.set("b", 6)
+    assert board.top(2) == [(6, ["b"]), (5, ["a"])]
+    board.remove("b")
+    board.set("a", 0)
+    assert board.top() == []
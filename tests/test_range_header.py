@@ -0,0 +1,37 @@
+from check_loader import load_definitions
+
+check = load_definitions("parse_range_header")
+parse = check.parse_range_header
+
+
+def test_no_or_unsupported_header_serves_whole_body():
+    assert parse(None, 100) is None
+    assert parse("", 100) is None
+    assert parse("items=0-10", 100) is None
+    assert parse("bytes=0-1,5-6", 100) is None  # multiple ranges are not supported
+    assert parse("bytes=-", 100) is None
+    assert parse("bytes=a-b", 100) is None
+
+
+def test_closed_and_open_ranges():
+    assert parse("bytes=0-99", 100) == (0, 99)
+    assert parse("bytes=10-19", 100) == (10, 19)
+    assert parse("bytes=90-", 100) == (90, 99)
+
+
+def test_end_is_clamped_to_size():
+    assert parse("bytes=50-500", 100) == (50, 99)
+
+
+def test_suffix_ranges():
+    assert parse("bytes=-10", 100) == (90, 99)
+    assert parse("bytes=-100", 100) == (0, 99)
+    assert parse("bytes=-500", 100) == (0, 99)
+
+
+def test_unsatisfiable_ranges():
+    assert parse("bytes=100-", 100) is False
+    assert parse("bytes=150-200", 100) is False
+    assert parse("bytes=20-10", 100) is False
+    assert parse("bytes=0-", 0) is False
+    assert parse("bytes=-0", 100) is False
@@ -0,0 +1,70 @@
+from check_loader import load_definitions
+
+check = load_definitions(
+    "SEARCH_FIELD_WEIGHTS", "SEARCH_WORD_RE", "search_words", "word_trigrams", "query_trigrams", "SearchIndex",
+)
+
+
+def video(uuid, title, desc="", uploaded_by="someone"):
+    return {"uuid": uuid, "title": title, "desc": desc, "uploaded_by": uploaded_by}
+
+
+def make_index(*videos):
+    index = check.SearchIndex()
+    index.add_many(videos)
+    return index
+
+
+def test_long_word_matches_inside_a_word():
+    index = make_index(video("a", "Skateboarding tricks"), video("b", "Cooking pasta"))
+    assert index.search("board") == ["a"]
+
+
+def test_short_word_matches_word_starts_only():
+    index = make_index(video("a", "Go karting"), video("b", "Tango night"))
+    assert index.search("go") == ["a"]
+
+
+def test_every_query_word_must_match():
+    index = make_index(video("a", "Beach volleyball"), video("b", "Beach sunset"))
+    assert index.search("beach sunset") == ["b"]
+    assert index.search("beach mountain") == []
+
+
+def test_trigram_false_positive_is_dropped():
+    # "abcab" carries every trigram of "cabc" but does not contain it
+    index = make_index(video("a", "abcab"))
+    assert index.search("cabc") == []
+
+
+def test_title_ranks_above_uploader_above_description():
+    index = make_index(
+        video("desc", "Holiday", desc="guitar lesson"),
+        video("title", "Guitar lesson"),
+        video("uploader", "Holiday", uploaded_by="guitar"),
+    )
+    assert index.search("guitar") == ["title", "uploader", "desc"]
+
+
+def test_exact_word_ranks_above_prefix_above_substring():
+    index = make_index(video("sub", "Soundcheck"), video("exact", "Check"), video("prefix", "Checkpoint"))
+    assert index.search("check") == ["exact", "prefix", "sub"]
+
+
+def test_limit_keeps_the_best():
+    index = make_index(video("exact", "Check"), video("prefix", "Checkpoint"), video("sub", "Soundcheck"))
+    assert index.search("check", limit=2) == ["exact", "prefix"]
+
+
+def test_update_and_remove():
+    index = make_index(video("a", "Old title"))
+    index.add(video("a", "New title"))
+    assert index.search("old") == []
+    assert index.search("new") == ["a"]
+    index.remove("a")
+    assert index.search("title") == []
+
+
+def test_empty_query():
+    index = make_index(video("a", "Anything"))
+    assert index.search("  !! ") == []
@@ -0,0 +1,50 @@
+import time
+
+from check_loader import load_definitions
+
+check = load_definitions("SESSION_TTL", "SESSION_CACHE_MAX", "SessionStore")
+
+
+def make_token(store, session_id="abc123", username="alice", expires=None):
+    expires = int(time.time()) + 3600 if expires is None else expires
+    user_hex = username.encode().hex()
+    return f"{session_id}.{user_hex}.{expires}.{store._sign(session_id, user_hex, expires)}"
+
+
+def test_valid_token():
+    store = check.SessionStore(b"secret")
+    assert store._verify(make_token(store)) == ("abc123", "alice")
+
+
+def test_tampered_signature():
+    store = check.SessionStore(b"secret")
+    token = make_token(store)
+    flipped = "0" if token[-1] != "0" else "1"
+    assert store._verify(token[:-1] + flipped) is None
+
+
+def test_tampered_fields():
+    store = check.SessionStore(b"secret")
+    session_id, user_hex, expires, signature = make_token(store).split(".")
+    assert store._verify(f"other.{user_hex}.{expires}.{signature}") is None
+    assert store._verify(f"{session_id}.{'bob'.encode().hex()}.{expires}.{signature}") is None
+    assert store._verify(f"{session_id}.{user_hex}.{int(expires) + 86400}.{signature}") is None
+
+
+def test_other_secret():
+    token = make_token(check.SessionStore(b"secret"))
+    assert check.SessionStore(b"another secret")._verify(token) is None
+
+
+def test_expired_token():
+    store = check.SessionStore(b"secret")
+    assert store._verify(make_token(store, expires=int(time.time()) - 1)) is None
+
+
+def test_malformed_tokens():
+    store = check.SessionStore(b"secret")
+    for token in ["", "abc", "a.b.c", "a.b.notanumber.sig", "a.b.c.d.e"]:
+        assert store._verify(token) is None
+    # Correctly signed but the user part is not hex
+    expires = int(time.time()) + 3600
+    assert store._verify(f"abc.zz.{expires}.{store._sign('abc', 'zz', expires)}") is None